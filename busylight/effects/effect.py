@@ -5,41 +5,59 @@
 import abc
 import asyncio
 
-from itertools import cycle
-from typing import List
-
-from loguru import logger
+from typing import AsyncGenerator, Awaitable, Callable, Dict, List, Tuple, Type
 
 from ..color import ColorList, ColorTuple
 from ..lights import USBLight
 
 
 class BaseEffect(abc.ABC):
+
+    # Subclasses are registered once at import time by
+    # __init_subclass__, so the subclass list and the name
+    # lookup tables are built once rather than walking the
+    # class tree on every call to subclasses or for_name.
+
+    _all_subclasses: List[Type["BaseEffect"]] = []
+    _name_index: Dict[Type["BaseEffect"], Dict[str, Type["BaseEffect"]]] = {}
+
+    # Effect name, set to the subclass name unless the subclass defines it.
+    name: str = "BaseEffect"
+
+    # Interval in seconds for current frame of the effect to be displayed.
+    duty_cycle: float = 0
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "name" not in cls.__dict__:
+            cls.name = cls.__name__
+        BaseEffect._all_subclasses.append(cls)
+        BaseEffect._name_index.clear()
+
     @classmethod
     def subclasses(cls) -> List["BaseEffect"]:
         """Returns a list of Effect subclasses."""
-        subclasses = []
         if cls is BaseEffect:
-            for subclass in cls.__subclasses__():
-                subclasses.extend(subclass.subclasses())
-            logger.debug(f"{cls.__name__} found {len(subclasses)}")
-            return subclasses
-
-        subclasses.append(cls)
-        for subclass in cls.__subclasses__():
-            subclasses.extend(subclass.subclasses())
-        logger.debug(f"{cls.__name__} found {len(subclasses)}")
-        return subclasses
+            return list(cls._all_subclasses)
+        return [c for c in cls._all_subclasses if issubclass(c, cls)]
 
     @classmethod
     def for_name(cls, name: str) -> "BaseEffect":
-
-        casefolded_name = name.casefold()
-        for subclass in cls.subclasses():
-            if subclass.__name__.casefold() == casefolded_name:
-                return subclass
-        else:
-            raise ValueError(f"Unknown effect {name}")
+        """Returns the Effect subclass whose name matches `name`, ignoring case.
+
+        Raises:
+        - ValueError
+        """
+        try:
+            name_index = cls._name_index[cls]
+        except KeyError:
+            name_index = {c.__name__.casefold(): c for c in cls.subclasses()}
+            cls._name_index[cls] = name_index
+
+        try:
+            return name_index[name.casefold()]
+        except KeyError:
+            raise ValueError(f"Unknown effect {name}") from None
 
     def __repr__(self) -> str:
 
@@ -49,26 +67,63 @@ class BaseEffect(abc.ABC):
 
         return f"{self.name} duty_cycle={self.duty_cycle}"
 
-    @property
-    def name(self) -> str:
-        return self.__class__.__name__
-
-    @property
-    def duty_cycle(self) -> float:
-        """Interval in seconds for current frame of the effect to be displayed."""
-        return getattr(self, "_duty_cycle", 0)
-
-    @duty_cycle.setter
-    def duty_cycle(self, seconds: float) -> None:
-        self._duty_cycle = seconds
-
     @property
     @abc.abstractmethod
     def colors(self) -> ColorList:
         """A list of color tuples."""
 
+    @property
+    def color_buffer(self) -> Tuple[ColorTuple, ...]:
+        """The effect's colors as a tuple, computed once and shared by
+        every light displaying the effect.
+        """
+        try:
+            return self._color_buffer
+        except AttributeError:
+            pass
+        self._color_buffer = tuple(self.colors)
+        return self._color_buffer
+
+    async def frames(
+        self,
+        wait: Callable[[float], Awaitable] = asyncio.sleep,
+    ) -> AsyncGenerator[ColorTuple, None]:
+        """Yields the effect's colors in order, forever, one per duty cycle.
+
+        Frames are scheduled against a monotonic deadline so the time
+        the caller spends displaying a frame does not accumulate as
+        drift. Between frames the generator awaits `wait` with the
+        number of seconds until the next frame is due. If the caller
+        falls behind by more than a duty cycle, the schedule restarts
+        from the current time rather than yielding the missed frames
+        back to back. Nothing is yielded if the effect has no colors.
+
+        :wait: coroutine function accepting a delay in seconds
+        :return: AsyncGenerator[ColorTuple, None]
+        """
+        colors = self.color_buffer
+        ncolors = len(colors)
+        if not ncolors:
+            return
+
+        duty_cycle = self.duty_cycle
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        index = 0
+        while True:
+            yield colors[index]
+            index = (index + 1) % ncolors
+            now = loop.time()
+            deadline = max(deadline + duty_cycle, now)
+            await wait(deadline - now)
+
     async def __call__(self, light: USBLight) -> None:
-        """"""
-        for color in cycle(self.colors):
-            light.on(color)
-            await asyncio.sleep(self.duty_cycle)
+        """Displays the effect's colors on `light` in order, forever.
+
+        Returns immediately if the effect has no colors.
+
+        :light: USBLight
+        """
+        on = light.on
+        async for color in self.frames():
+            on(color)
@@ -8,16 +8,15 @@ from .effect import BaseEffect
 
 
 class Steady(BaseEffect):
+
+    duty_cycle = 86400
+
     def __init__(self, color: ColorTuple) -> None:
         self.color = color
 
     def __repr__(self) -> str:
         return f"{self.name}(color={self.color!r})"
 
-    @property
-    def duty_cycle(self) -> float:
-        return 86400
-
     @property
     def colors(self) -> ColorList:
         try:
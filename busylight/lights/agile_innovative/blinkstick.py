@@ -76,11 +76,12 @@ class BlinkStick(USBLight):
         # USBLight.strategy method.
 
         r, g, b = self.color
+        report = self.report
 
-        if self.report == Report.Single:
-            return bytes([self.report, g, r, b])
+        if report == Report.Single:
+            return bytes([report, g, r, b])
 
-        buf = [self.report, self.channel]
+        buf = [report, self.channel]
         buf.extend([g, r, b] * self.nleds)
 
         return bytes(buf)
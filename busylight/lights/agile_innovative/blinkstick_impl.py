@@ -2,6 +2,8 @@
 """
 
 from enum import IntEnum
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from loguru import logger
 
@@ -20,17 +22,20 @@ class Report(IntEnum):
 
     @classmethod
     def from_nleds(cls, nleds: int) -> "Report":
-        if nleds == 1:
-            return cls.Single
-        if nleds <= 8:
-            return cls.Leds8
-        if nleds <= 16:
-            return cls.Leds16
-        if nleds <= 32:
-            return cls.Leds32
-        if nleds <= 64:
-            return cls.Leds64
-        raise ValueError("No {cls.__name__} match for {nleds} leds")
+        if 0 < nleds <= len(_NLEDS_TO_REPORT):
+            return _NLEDS_TO_REPORT[nleds - 1]
+        raise ValueError(f"No {cls.__name__} match for {nleds} leds")
+
+
+# Indexed by number of leds minus one.
+
+_NLEDS_TO_REPORT: Tuple[Report, ...] = (
+    (Report.Single,)
+    + (Report.Leds8,) * 7  # 2 - 8 leds
+    + (Report.Leds16,) * 8  # 9 - 16 leds
+    + (Report.Leds32,) * 16  # 17 - 32 leds
+    + (Report.Leds64,) * 32  # 33 - 64 leds
+)
 
 
 class BlinkStickType(IntEnum):
@@ -43,60 +48,88 @@ class BlinkStickType(IntEnum):
 
     @classmethod
     def from_dict(cls, hidinfo: HidInfo) -> "BlinkStickType":
-        try:
-            return cls(int(hidinfo["serial_number"].split("-")[-1].split(".")[0]))
-        except KeyError as error:
-            logger.error(f"serial_number missing from hidinfo -> {error} {hidinfo}")
-            raise LightUnsupported.from_dict(hidinfo)
-        except IndexError as error:
+        blinkstick_type = _resolve(
+            hidinfo.get("serial_number"),
+            hidinfo.get("release_number"),
+        )
+        if blinkstick_type is None:
             logger.error(
-                f"failed to find major number in {hidinfo['serial_number']} {error}"
+                f"no {cls.__name__} for serial_number "
+                f"{hidinfo.get('serial_number')} "
+                f"release_number {hidinfo.get('release_number')}"
             )
             raise LightUnsupported.from_dict(hidinfo)
-        except ValueError as error:
-            logger.debug(f"{error}")
-
-        try:
-            return cls(int(hidinfo["release_number"]))
-        except KeyError as error:
-            logger.error(f"failed to find release_number {error}")
-        except ValueError as error:
-            logger.error(f"unknown release {hidinfo['release_number']} {error}")
-
-        raise LightUnsupported.from_dict(hidinfo)
+        return blinkstick_type
 
     @property
     def name(self) -> "str":
-        return {
-            0x001: "BlinkStick",
-            0x002: "BlinkStick Pro",
-            0x200: "BlinkStick Square",
-            0x201: "BlinkStick Strip",
-            0x202: "BlinkStick Nano",
-            0x203: "BlinkStick Flex",
-        }[self.value]
+        return _NAMES[self]
 
     @property
     def nleds(self) -> int:
+        return _NLEDS[self]
+
+    @property
+    def report(self) -> Report:
         try:
-            return {
-                0x001: 1,
-                0x002: 192,
-                0x200: 8,
-                0x201: 8,
-                0x202: 2,
-                0x203: 32,
-            }[self.value]
+            return _REPORTS[self]
         except KeyError:
             raise ValueError(
-                "Unknown {self.__class__.__name__} value {self.value}"
+                f"No {Report.__name__} match for {self.nleds} leds"
             ) from None
 
-    @property
-    def report(self) -> Report:
-        try:
-            return self._report
-        except AttributeError:
-            pass
-        self._report = Report.from_nleds(self.nleds)
-        return self._report
+
+_NAMES = {
+    BlinkStickType.BlinkStick: "BlinkStick",
+    BlinkStickType.Pro: "BlinkStick Pro",
+    BlinkStickType.Square: "BlinkStick Square",
+    BlinkStickType.Strip: "BlinkStick Strip",
+    BlinkStickType.Nano: "BlinkStick Nano",
+    BlinkStickType.Flex: "BlinkStick Flex",
+}
+
+_NLEDS = {
+    BlinkStickType.BlinkStick: 1,
+    BlinkStickType.Pro: 192,
+    BlinkStickType.Square: 8,
+    BlinkStickType.Strip: 8,
+    BlinkStickType.Nano: 2,
+    BlinkStickType.Flex: 32,
+}
+
+_VALUES = {member.value: member for member in BlinkStickType}
+
+
+@lru_cache(maxsize=256)
+def _resolve(
+    serial_number: Optional[str],
+    release_number: Optional[int],
+) -> Optional[BlinkStickType]:
+    """Returns the BlinkStickType identified by the device's serial number
+    or release number, or None if the device is not recognized.
+
+    Results are cached since repeated enumeration finds the same devices,
+    so this function must not have side effects like logging.
+    """
+    if serial_number is None:
+        return None
+
+    major = serial_number.split("-")[-1].split(".", 1)[0]
+    if major.isdecimal():
+        blinkstick_type = _VALUES.get(int(major))
+        if blinkstick_type is not None:
+            return blinkstick_type
+
+    if release_number is None:
+        return None
+
+    return _VALUES.get(release_number)
+
+
+# The BlinkStick Pro drives 192 leds across three channels and
+# there is no single report that covers it, so it is left out of
+# the precomputed reports and the report property raises ValueError.
+
+_REPORTS = {
+    member: Report.from_nleds(nleds) for member, nleds in _NLEDS.items() if nleds <= 64
+}
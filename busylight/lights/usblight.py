@@ -371,7 +371,8 @@ class USBLight(abc.ABC):
         """Adds `coroutine` to the list of tasks associated with this light
         and returns the asyncio.Task created.
 
-        If a task with `name` already exists, that task is returned.
+        If an unfinished task with `name` already exists, that task is
+        returned.
 
         The task is created with coroutine called with this light as
         it's only argument.
@@ -383,7 +384,7 @@ class USBLight(abc.ABC):
         logger.debug(f"name: {name} {coroutine}")
 
         task = self.tasks.get(name)
-        if task:
+        if task and not task.done():
             return task
 
         loop = asyncio.get_event_loop()
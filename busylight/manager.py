@@ -3,7 +3,8 @@
 
 import asyncio
 
-from typing import Dict, List, Optional, Union, Tuple
+from time import monotonic
+from typing import Awaitable, Dict, List, Optional, Set, Union, Tuple
 from loguru import logger
 
 from .color import ColorTuple
@@ -11,16 +12,50 @@ from .effects import Effects
 from .lights import LightUnavailable, NoLightsFound, USBLight, Speed
 
 
+def _device_key(hidinfo: Dict) -> Tuple:
+    """Returns a tuple identifying the device described by `hidinfo`."""
+    return hidinfo.get("vendor_id"), hidinfo.get("product_id"), hidinfo.get("path")
+
+
+async def _broadcast_member(light: USBLight) -> None:
+    """Placeholder task marking `light` as driven by a broadcast effect.
+
+    The task never completes on its own; cancelling it removes the
+    light from the broadcast. See LightManager.effect_supervisor.
+    """
+    await asyncio.Event().wait()
+
+
+def _same_effect(a: Effects, b: Effects) -> bool:
+    """True if effects `a` and `b` display the same frames at the same rate."""
+    return a is b or (
+        type(a) is type(b)
+        and a.duty_cycle == b.duty_cycle
+        and a.color_buffer == b.color_buffer
+    )
+
+
 class LightManager:
-    def __init__(self, greedy: bool = True, lightclass: type = None):
+    def __init__(
+        self,
+        greedy: bool = True,
+        lightclass: type = None,
+        ttl: float = 2.0,
+    ):
         """
         :greedy: bool
         :lightclass: USBLight or subclass
+        :ttl: float seconds
 
         If `greedy` is True, the default, then calls to the update
         method will look for lights that have been plugged in since
         the last update.
 
+        Enumerating USB devices can be slow, so the update method
+        will not look for new lights if lights were enumerated less
+        than `ttl` seconds ago. Call the refresh method to force the
+        next update to look for new lights.
+
         If the caller supplies a `lightclass`, which is expected to
         be USBLight or a subclass, the light manager will only
         manage lights returned by `lightclass.all_lights()`. If the
@@ -28,6 +63,12 @@ class LightManager:
         """
 
         self.greedy = greedy
+        self._lights_ttl = ttl
+        self._lights_cached_at = 0.0
+        self._next_id = 0
+        self._applied_effects: Dict[int, Tuple[asyncio.Task, Effects]] = {}
+        self._broadcasts: Set[asyncio.Task] = set()
+        self._scheduled: Set[asyncio.Task] = set()
 
         if lightclass is None:
             self._lightclass = USBLight
@@ -47,7 +88,10 @@ class LightManager:
 
     def __str__(self) -> str:
         return "\n".join(
-            [f"{n:3d} {light.name}" for n, light in enumerate(self.lights)]
+            [
+                f"{light_id:3d} {light.name}"
+                for light_id, light in self._managed_lights().items()
+            ]
         )
 
     def __len__(self) -> int:
@@ -64,20 +108,41 @@ class LightManager:
 
     @property
     def lights(self) -> List[USBLight]:
-        """List of managed lights."""
+        """List of managed lights, ordered by light id."""
+        return list(self._managed_lights().values())
+
+    def _managed_lights(self) -> Dict[int, USBLight]:
+        """Dictionary of managed lights keyed by light id.
+
+        Lights are enumerated the first time this method is called.
+        """
         try:
             return self._lights
         except AttributeError:
             pass
-        self._lights = list(self.lightclass.all_lights(reset=False))
+        self._lights = {}
+        self._add_lights(self.lightclass.all_lights(reset=False))
+        self._lights_cached_at = monotonic()
         return self._lights
 
+    def _add_lights(self, lights: List[USBLight]) -> None:
+        """Adds `lights` to the managed lights, assigning each the next
+        light id. Light ids are not reused while the lights are managed;
+        they are assigned from zero again after the lights are released.
+        """
+        next_id = self._next_id
+        for light in lights:
+            self._lights[next_id] = light
+            next_id += 1
+        self._next_id = next_id
+
     def selected_lights(self, indices: List[int] = None) -> List[USBLight]:
-        """Return a list of USBLights matching the list of `indices`.
+        """Return a list of USBLights whose light ids are in `indices`.
 
         If `indices` is empty, all managed lights are returned.
 
-        If there are no lights with matching indices, an empty list is returned.
+        Indices that do not match a managed light are ignored. If none of
+        the indices match, NoLightsFound is raised.
 
         :indices: List[int]
         :return: List[USBLight]
@@ -85,15 +150,14 @@ class LightManager:
         Raises:
         - NoLightsFound
         """
-        if not indices:
-            indices = range(0, len(self.lights))
+        lights = self._managed_lights()
 
-        selected_lights = []
-        for index in indices:
-            try:
-                selected_lights.append(self.lights[index])
-            except IndexError as error:
-                logger.debug(f"index:{index} {error}")
+        if not indices:
+            selected_lights = list(lights.values())
+        else:
+            selected_lights = [
+                light for light in map(lights.get, indices) if light is not None
+            ]
 
         if selected_lights:
             return selected_lights
@@ -104,65 +168,144 @@ class LightManager:
         """Updates managed lights list.
 
         This method looks for newly plugged in lights if the greedy
-        property is True. It then surveys known lights, building a
+        property is True and lights were not enumerated within the
+        last `ttl` seconds. It then surveys known lights, building a
         count of plugged in lights and unplugged lights. New lights
-        are appended to the end of the `lights` property in order to
-        keep the light index order stable over the lifetime of the
-        manager. The return value is an integer three-tuple which
-        records the number of new lights found, the number of
-        previously known lights that are still active and the number
-        of previously known lights that are now inactive.
+        are assigned the next unused light id in order to keep the
+        light ids stable over the lifetime of the manager. The return
+        value is an integer three-tuple which records the number of
+        new lights found, the number of previously known lights that
+        are still active and the number of previously known lights
+        that are now inactive.
 
         :return: Tuple[# new lights, # active lights, # inactive lights]
         """
-        if self.greedy:
-            new_lights = self.lightclass.all_lights()
+        lights = self.lights
+        new_lights = []
+
+        if self.greedy and monotonic() - self._lights_cached_at >= self._lights_ttl:
+            # Known lights are skipped before a light is built from the
+            # hidinfo, since building a light opens and resets the device.
+            known = {_device_key(light.hidinfo) for light in lights}
+            for hidinfo in self.lightclass.available():
+                if _device_key(hidinfo) in known:
+                    continue
+                try:
+                    new_lights.append(self.lightclass.from_dict(hidinfo))
+                except LightUnavailable as error:
+                    logger.debug(f"{self.lightclass.__name__} {error}")
+            self._lights_cached_at = monotonic()
             logger.debug(f"{len(new_lights)} new {new_lights}")
 
-        active_lights = [light for light in self.lights if light.is_pluggedin]
-
-        inactive_lights = [light for light in self.lights if light.is_unplugged]
+        active_lights = []
+        inactive_lights = []
+        for light in lights:
+            if light.is_pluggedin:
+                active_lights.append(light)
+            else:
+                inactive_lights.append(light)
 
-        self._lights += new_lights
+        self._add_lights(new_lights)
 
         return len(new_lights), len(active_lights), len(inactive_lights)
 
+    def refresh(self) -> None:
+        """Forces the next update to look for new lights, regardless of
+        how recently lights were enumerated.
+        """
+        self._lights_cached_at = 0.0
+
     def release(self) -> None:
-        """Release managed lights."""
+        """Release managed lights.
 
-        # EJO Is this better than calling self._lights.clear()?
-        #     This implementation forces the finalization of each
-        #     light and adds some logging. I'm not sure it's
-        #     worth the added complexity.
+        The managed lights are dropped in one step; each light
+        releases its device when it is finalized. Light ids are
+        assigned from zero again when lights are next enumerated.
+        """
         try:
-            while self._lights:
-                light = self._lights.pop()
-                del light
-        except (IndexError, AttributeError) as error:
+            lights = self._lights
+            del self._lights
+        except AttributeError as error:
             logger.debug(f"during release {error}")
+            return
+
+        self._next_id = 0
+        self._applied_effects.clear()
+        lights.clear()
 
+    def _run(self, coroutine: Awaitable) -> Optional[asyncio.Task]:
+        """Runs `coroutine` to completion in a new event loop, or schedules
+        it as a task on the current event loop if one is already running.
+
+        The manager holds a reference to a scheduled task until it is
+        done and logs any exception it raises, but the caller should
+        await the returned task to wait for it to finish and to receive
+        its exceptions.
+
+        :coroutine: Awaitable
+        :return: asyncio.Task or None
+        """
         try:
-            del self._lights
-        except AttributeError as error:
-            logger.debug(f"during release, failed to del _lights property {error}")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(coroutine)
+            return None
+        task = loop.create_task(coroutine)
+        self._scheduled.add(task)
+        task.add_done_callback(self._scheduled_done)
+        return task
+
+    def _scheduled_done(self, task: asyncio.Task) -> None:
+        """Forgets a task scheduled by `_run` and logs its exception, if any.
+
+        :task: asyncio.Task
+        """
+        self._scheduled.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"{task.get_name()} failed: {task.exception()!r}")
 
     def on(
         self,
         color: ColorTuple,
         light_ids: List[int] = None,
         timeout: float = None,
-    ) -> None:
+    ) -> Optional[asyncio.Task]:
         """Turn on all the lights whose indices are in the `lights` list.
 
+        If called while an event loop is running, the work is scheduled as
+        a task on that loop and the task is returned; await it to wait for
+        the work to finish and to receive any exception. Otherwise the call
+        blocks until the lights are on, returning None.
+
         :color: ColorTuple
         :lights: List[int]
         :timeout: float seconds
+        :return: asyncio.Task or None
 
         Raises:
         - NoLightsFound
         """
+        lights = self.selected_lights(light_ids)
+        return self._run(self.on_supervisor(color, lights, timeout))
 
-        asyncio.run(self.on_supervisor(color, self.selected_lights(light_ids), timeout))
+    async def on_async(
+        self,
+        color: ColorTuple,
+        light_ids: List[int] = None,
+        timeout: float = None,
+    ) -> None:
+        """Turn on all the lights whose indices are in the `lights` list.
+
+        Coroutine version of `on` for use within a running event loop.
+
+        :color: ColorTuple
+        :lights: List[int]
+        :timeout: float seconds
+
+        Raises:
+        - NoLightsFound
+        """
+        await self.on_supervisor(color, self.selected_lights(light_ids), timeout)
 
     async def on_supervisor(
         self,
@@ -171,11 +314,22 @@ class LightManager:
         timeout: float = None,
         wait: bool = True,
     ) -> None:
-        """"""
-        awaitables = []
+        """Turns on each of the `lights` with `color` and awaits any tasks
+        the lights start. If a timeout in seconds is specified, the wait
+        ends at the end of the period.
+
+        The lights are written on the event loop's thread, one after
+        the other, so writes never race with tasks the lights run on
+        the loop, like the Kuando keepalive.
+
+        :color: ColorTuple
+        :lights: List[USBLight]
+        :timeout: float seconds
+        """
         for light in lights:
             light.on(color)
-            awaitables.extend(light.tasks.values())
+
+        awaitables = [task for light in lights for task in light.tasks.values()]
 
         if awaitables and wait:
             await asyncio.wait(awaitables, timeout=timeout)
@@ -185,10 +339,38 @@ class LightManager:
         effect: Effects,
         light_ids: List[int] = None,
         timeout: float = None,
+    ) -> Optional[asyncio.Task]:
+        """Applies the given `effect` to all of the lights whose indices are
+        in the `lights` list.
+
+        If called while an event loop is running, the work is scheduled as
+        a task on that loop and the task is returned; await it to wait for
+        the work to finish and to receive any exception. Otherwise the call
+        blocks until the effect ends, returning None.
+
+        :effect: FrameGenerator
+        :lights: List[int]
+        :timeout: float seconds
+        :return: asyncio.Task or None
+
+        Raises:
+        - NoLightsFound
+        """
+        lights = self.selected_lights(light_ids)
+        return self._run(self.effect_supervisor(effect, lights, timeout))
+
+    async def apply_effect_async(
+        self,
+        effect: Effects,
+        light_ids: List[int] = None,
+        timeout: float = None,
     ) -> None:
         """Applies the given `effect` to all of the lights whose indices are
         in the `lights` list.
 
+        Coroutine version of `apply_effect` for use within a running event
+        loop.
+
         :effect: FrameGenerator
         :lights: List[int]
         :timeout: float seconds
@@ -196,9 +378,7 @@ class LightManager:
         Raises:
         - NoLightsFound
         """
-        asyncio.run(
-            self.effect_supervisor(effect, self.selected_lights(light_ids), timeout)
-        )
+        await self.effect_supervisor(effect, self.selected_lights(light_ids), timeout)
 
     async def effect_supervisor(
         self,
@@ -207,24 +387,118 @@ class LightManager:
         timeout: float = None,
         wait: bool = True,
     ) -> None:
-        """Builds a list of awaitable coroutines to perform the given `effect`
-        on each of the `lights` and awaits the exit of the coroutines (which
-        typically do not exit). If a timeout in seconds is specified, the
-        effect will stop at the end of the period.
+        """Performs the given `effect` on each of the `lights` and awaits
+        the exit of the lights' tasks (which typically do not exit). If a
+        timeout in seconds is specified, the effect will stop at the end
+        of the period.
+
+        A single broadcast task computes each frame of the effect once
+        and writes it to all of the lights. Each light is given a
+        placeholder task named for the effect; cancelling a light's
+        tasks removes just that light from the broadcast.
+
+        Lights already running an equivalent effect started by this
+        manager are left undisturbed rather than cancelled and restarted.
+
+        If `wait` is True, the effect is stopped when the wait ends,
+        either at the end of the timeout period or when this coroutine
+        is cancelled.
 
         :effect:
         :lights: List[USBLight]
         :timeout: float seconds
         """
 
-        awaitables = []
+        members = []
         for light in lights:
-            light.cancel_tasks()
-            light.add_task(effect.name, effect)
-            awaitables.extend(light.tasks.values())
+            task, applied = self._applied_effects.get(id(light), (None, None))
+            if (
+                task is None
+                or task.done()
+                or light.tasks.get(applied.name) is not task
+                or not _same_effect(applied, effect)
+            ):
+                light.cancel_tasks()
+                task = light.add_task(effect.name, _broadcast_member)
+                self._applied_effects[id(light)] = (task, effect)
+                if task:
+                    members.append((light, task))
+
+        if members:
+            broadcast = asyncio.get_running_loop().create_task(
+                self._broadcast(effect, members),
+                name=f"{effect.name}-broadcast-{id(self)}",
+            )
+            self._broadcasts.add(broadcast)
+            broadcast.add_done_callback(self._broadcasts.discard)
+
+        awaitables = [task for light in lights for task in light.tasks.values()]
+
+        if not (awaitables and wait):
+            return
 
-        if awaitables and wait:
+        try:
             await asyncio.wait(awaitables, timeout=timeout)
+        finally:
+            # Stop the effect when the wait ends, whether by timeout
+            # or by cancellation, rather than leaving its tasks
+            # running until the event loop is closed. The tasks are
+            # forgotten as well as cancelled, since a cancelled task is
+            # not done until the loop next runs it and would otherwise
+            # look like an effect that is still running.
+            for light in lights:
+                self._applied_effects.pop(id(light), None)
+                task = light.tasks.pop(effect.name, None)
+                if task:
+                    task.cancel()
+
+    async def _broadcast(
+        self,
+        effect: Effects,
+        members: List[Tuple[USBLight, asyncio.Task]],
+    ) -> None:
+        """Displays the frames of `effect` on each light in `members`.
+
+        Each frame is written to all of the lights in turn. A light is
+        dropped from the broadcast when its placeholder task is no
+        longer one of the light's tasks or a write to it fails, and the
+        broadcast ends when no lights remain, or immediately if the
+        effect has no colors.
+
+        :effect: Effects
+        :members: List[Tuple[USBLight, asyncio.Task]]
+        """
+
+        # Waiting on the placeholder tasks rather than sleeping ends
+        # the broadcast promptly when all of its lights have been
+        # cancelled, even for long duty cycles.
+        async def wait(delay: float) -> None:
+            await asyncio.wait([task for _, task in members], timeout=delay)
+
+        frames = effect.frames(wait)
+        try:
+            async for color in frames:
+                members = [
+                    (light, task)
+                    for light, task in members
+                    if light.tasks.get(effect.name) is task and not task.done()
+                ]
+                if not members:
+                    return
+
+                for light, task in members:
+                    try:
+                        light.on(color)
+                    except (LightUnavailable, OSError) as error:
+                        logger.debug(f"{effect.name} dropping {light!r} {error}")
+                        task.cancel()
+                    except Exception as error:
+                        # One misbehaving light must not end the
+                        # broadcast for the rest of the lights.
+                        logger.error(f"{effect.name} dropping {light!r} {error!r}")
+                        task.cancel()
+        finally:
+            await frames.aclose()
 
     def off(self, lights: List[int] = None) -> None:
         """Turn off all the lights whose indices are in the `lights` list.
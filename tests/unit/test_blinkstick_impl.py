@@ -0,0 +1,112 @@
+"""
+"""
+
+from unittest import mock
+
+import pytest
+
+from busylight.lights import LightUnsupported
+from busylight.lights.agile_innovative.blinkstick_impl import BlinkStickType, Report
+
+
+@pytest.mark.parametrize(
+    "member,name,nleds,report",
+    [
+        (BlinkStickType.BlinkStick, "BlinkStick", 1, Report.Single),
+        (BlinkStickType.Square, "BlinkStick Square", 8, Report.Leds8),
+        (BlinkStickType.Strip, "BlinkStick Strip", 8, Report.Leds8),
+        (BlinkStickType.Nano, "BlinkStick Nano", 2, Report.Leds8),
+        (BlinkStickType.Flex, "BlinkStick Flex", 32, Report.Leds32),
+    ],
+)
+def test_blinkstick_type_properties(member, name, nleds, report) -> None:
+
+    assert member.name == name
+    assert member.nleds == nleds
+    assert member.report == report
+
+
+def test_blinkstick_type_pro() -> None:
+
+    assert BlinkStickType.Pro.name == "BlinkStick Pro"
+    assert BlinkStickType.Pro.nleds == 192
+
+    with pytest.raises(ValueError):
+        BlinkStickType.Pro.report
+
+
+@pytest.mark.parametrize(
+    "nleds,report",
+    [
+        (1, Report.Single),
+        (2, Report.Leds8),
+        (8, Report.Leds8),
+        (9, Report.Leds16),
+        (16, Report.Leds16),
+        (17, Report.Leds32),
+        (32, Report.Leds32),
+        (33, Report.Leds64),
+        (64, Report.Leds64),
+    ],
+)
+def test_report_from_nleds(nleds: int, report: Report) -> None:
+
+    assert Report.from_nleds(nleds) == report
+
+
+@pytest.mark.parametrize("nleds", [-1, 0, 65, 192])
+def test_report_from_nleds_unsupported(nleds: int) -> None:
+
+    with pytest.raises(ValueError):
+        Report.from_nleds(nleds)
+
+
+@pytest.mark.parametrize(
+    "hidinfo,expected",
+    [
+        ({"serial_number": "BS000001-1.0"}, BlinkStickType.BlinkStick),
+        ({"serial_number": "BS000001-2.0"}, BlinkStickType.Pro),
+        ({"serial_number": "BS000001-2"}, BlinkStickType.Pro),
+        (
+            {"serial_number": "BS000001-x.0", "release_number": 0x202},
+            BlinkStickType.Nano,
+        ),
+        (
+            {"serial_number": "BS032974-3.0", "release_number": 0x200},
+            BlinkStickType.Square,
+        ),
+        (
+            {"serial_number": "BS032974-3.0", "release_number": 0x203},
+            BlinkStickType.Flex,
+        ),
+    ],
+)
+def test_blinkstick_type_from_dict(hidinfo, expected) -> None:
+
+    assert BlinkStickType.from_dict(hidinfo) == expected
+    assert BlinkStickType.from_dict(hidinfo) == expected
+
+
+@pytest.mark.parametrize(
+    "hidinfo",
+    [
+        {},
+        {"release_number": 0x200},
+        {"serial_number": "BS032974-3.0"},
+        {"serial_number": "BS032974-3.0", "release_number": 0x300},
+        {"serial_number": "BS032974-x.0", "release_number": 0x300},
+        {"serial_number": "", "release_number": 0x300},
+    ],
+)
+def test_blinkstick_type_from_dict_unsupported(hidinfo) -> None:
+
+    hidinfo.update({"vendor_id": 0x20A0, "product_id": 0x41E5, "path": b"bogus"})
+
+    with mock.patch(
+        "busylight.lights.agile_innovative.blinkstick_impl.logger"
+    ) as mock_logger:
+        for _ in range(2):
+            with pytest.raises(LightUnsupported):
+                BlinkStickType.from_dict(hidinfo)
+
+    assert mock_logger.error.call_count == 2
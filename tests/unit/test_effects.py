@@ -0,0 +1,195 @@
+"""
+"""
+
+import asyncio
+
+from unittest import mock
+
+import pytest
+
+from busylight.effects import Effects, Blink, Gradient, Spectrum, Steady
+
+
+ALL_EFFECTS = [Blink, Gradient, Spectrum, Steady]
+
+
+def test_effects_subclasses() -> None:
+
+    subclasses = Effects.subclasses()
+    assert isinstance(subclasses, list)
+    for effect in ALL_EFFECTS:
+        assert effect in subclasses
+
+
+@pytest.mark.parametrize("effect", ALL_EFFECTS)
+def test_effects_subclasses_of_subclass(effect) -> None:
+
+    assert effect.subclasses() == [effect]
+
+
+@pytest.mark.parametrize("effect", ALL_EFFECTS)
+def test_effects_for_name(effect) -> None:
+
+    name = effect.__name__
+    assert Effects.for_name(name) is effect
+    assert Effects.for_name(name.upper()) is effect
+    assert Effects.for_name(name.lower()) is effect
+
+
+@pytest.mark.parametrize("name", ["", "bogus", "throb"])
+def test_effects_for_name_unknown(name: str) -> None:
+
+    with pytest.raises(ValueError):
+        Effects.for_name(name)
+
+
+def test_effects_for_name_new_subclass() -> None:
+    class Bogus(Effects):
+        @property
+        def colors(self):
+            return [(0, 0, 0)]
+
+    try:
+        assert Effects.for_name("bogus") is Bogus
+    finally:
+        Effects._all_subclasses.remove(Bogus)
+        Effects._name_index.clear()
+
+
+def test_blink_colors() -> None:
+
+    blink = Blink((255, 0, 0), 0.1)
+    assert blink.colors == [(255, 0, 0), (0, 0, 0)]
+
+
+@pytest.mark.parametrize(
+    "effect",
+    [
+        Blink((255, 0, 0), 0),
+        Gradient((0, 255, 0), 0, 64),
+        Spectrum(0, steps=8),
+    ],
+)
+def test_effects_call(effect) -> None:
+
+    light = mock.Mock()
+
+    async def run_effect() -> None:
+        await asyncio.wait_for(effect(light), timeout=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run_effect())
+
+    colors = [call.args[0] for call in light.on.call_args_list]
+    assert len(colors) > len(effect.colors)
+    assert colors[: len(effect.colors)] == list(effect.colors)
+
+
+def test_effects_frames_after_stall() -> None:
+
+    effect = Blink((255, 0, 0), 0.1)
+    clock = [0.0]
+    delays = []
+
+    async def wait(delay: float) -> None:
+        delays.append(delay)
+        clock[0] += delay
+
+    async def take(count: int) -> None:
+        loop = asyncio.get_running_loop()
+        with mock.patch.object(loop, "time", lambda: clock[0]):
+            frames = effect.frames(wait)
+            try:
+                for n in range(count):
+                    await frames.__anext__()
+                    clock[0] += 0.01
+                    if n == 2:
+                        clock[0] += 0.5
+            finally:
+                await frames.aclose()
+
+    asyncio.run(take(8))
+
+    # the frame after the stall goes out immediately, then the effect
+    # resumes its duty cycle instead of bursting the missed frames.
+    assert delays[:2] == pytest.approx([0.09, 0.09])
+    assert delays[2] == 0
+    assert delays[3:] == pytest.approx([0.09] * (len(delays) - 3))
+
+
+@pytest.mark.parametrize(
+    "effect",
+    [
+        Blink((255, 0, 0), 0.1),
+        Gradient((0, 255, 0), 0.1, 64),
+        Spectrum(0.1, steps=8),
+        Steady((0, 0, 255)),
+    ],
+)
+def test_effects_color_buffer(effect) -> None:
+
+    buffer = effect.color_buffer
+    assert isinstance(buffer, tuple)
+    assert buffer == tuple(effect.colors)
+    assert effect.color_buffer is buffer
+
+
+@pytest.mark.parametrize("effect", ALL_EFFECTS)
+def test_effects_name(effect) -> None:
+
+    assert effect.name == effect.__name__
+
+
+@pytest.mark.parametrize(
+    "effect,duty_cycle",
+    [
+        (Blink((255, 0, 0), 0.5), 0.5),
+        (Gradient((0, 255, 0), 0.25), 0.25),
+        (Spectrum(0.125), 0.125),
+        (Steady((0, 0, 255)), 86400),
+    ],
+)
+def test_effects_duty_cycle(effect, duty_cycle) -> None:
+
+    assert effect.duty_cycle == duty_cycle
+    assert str(effect) == f"{effect.name} duty_cycle={duty_cycle}"
+
+
+def test_effects_call_no_colors() -> None:
+    class Empty(Effects):
+        @property
+        def colors(self):
+            return []
+
+    try:
+        light = mock.Mock()
+        asyncio.run(asyncio.wait_for(Empty()(light), timeout=1))
+        light.on.assert_not_called()
+    finally:
+        Effects._all_subclasses.remove(Empty)
+        Effects._name_index.clear()
+
+
+def test_effects_frames() -> None:
+
+    effect = Blink((255, 0, 0), 0.5)
+    delays = []
+
+    async def wait(delay: float) -> None:
+        delays.append(delay)
+
+    async def take(count: int) -> list:
+        frames = effect.frames(wait)
+        try:
+            return [await frames.__anext__() for _ in range(count)]
+        finally:
+            await frames.aclose()
+
+    colors = asyncio.run(take(5))
+
+    assert colors == [(255, 0, 0), (0, 0, 0)] * 2 + [(255, 0, 0)]
+    assert len(delays) == 4
+    # wait returns immediately, so each deadline lands one duty cycle
+    # further ahead of the clock than the last.
+    for n, delay in enumerate(delays, 1):
+        assert 0.5 * (n - 1) < delay <= 0.5 * n
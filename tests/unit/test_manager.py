@@ -1,13 +1,17 @@
 """
 """
 
+import asyncio
+
 from typing import Generator
 from unittest import mock
 
 import pytest
 
+from busylight.effects import Effects
 from busylight.manager import LightManager
-from busylight.lights import USBLight, NoLightsFound
+from busylight.lights import LightUnavailable, NoLightsFound, USBLight
+from busylight.lights.kuando import Busylight
 
 from .. import device_hidinfo
 
@@ -19,7 +23,8 @@ def synthetic_light_manager(synthetic_lights) -> Generator[USBLight, None, None]
 
     manager = LightManager()
 
-    manager._lights = list(synthetic_lights)
+    manager._lights = {}
+    manager._add_lights(synthetic_lights)
 
     yield manager
 
@@ -158,8 +163,8 @@ def test_list_manager_selected_lights_default(value, synthetic_light_manager) ->
     [
         [0],
         [1, 2],
-        [1, -1],
-        [1, 0, -1],
+        [1, 3],
+        [1, 0, 3],
     ],
 )
 def test_list_manager_selected_lights_default(indices, synthetic_light_manager) -> None:
@@ -181,25 +186,431 @@ def test_list_manager_selected_lights_out_of_bounds(synthetic_light_manager) ->
         # assert not results
 
 
-@pytest.mark.xfail
-def test_list_manager_update_no_change(synthetic_light_manager) -> None:
+@pytest.mark.parametrize("greedy", [True, False])
+def test_list_manager_update_no_change(greedy, synthetic_light_manager) -> None:
+
+    synthetic_light_manager.greedy = greedy
+    nlights = len(synthetic_light_manager.lights)
+    lightclass = synthetic_light_manager.lightclass
+
+    with mock.patch.object(
+        lightclass,
+        "available",
+        return_value=[light.hidinfo for light in synthetic_light_manager.lights],
+    ), mock.patch.object(lightclass, "from_dict") as mock_from_dict:
+        result = synthetic_light_manager.update()
 
-    assert False, "Not written yet"
+    assert result == (0, nlights, 0)
+    assert len(synthetic_light_manager.lights) == nlights
+    mock_from_dict.assert_not_called()
 
 
-@pytest.mark.xfail
 def test_list_manager_update_lights_removed(synthetic_light_manager) -> None:
 
-    assert False, "Not written yet"
+    synthetic_light_manager.greedy = False
+    nlights = len(synthetic_light_manager.lights)
+
+    unplugged = synthetic_light_manager.lights[:2]
+
+    for light in unplugged:
+        light.device.read.side_effect = OSError("unplugged")
+
+    try:
+        result = synthetic_light_manager.update()
+    finally:
+        for light in unplugged:
+            light.device.read.side_effect = None
+
+    assert result == (0, nlights - 2, 2)
+    assert len(synthetic_light_manager.lights) == nlights
 
 
-@pytest.mark.xfail
 def test_list_manager_update_lights_added(synthetic_light_manager) -> None:
 
-    assert False, "Not written yet"
+    nlights = len(synthetic_light_manager.lights)
+    lightclass = synthetic_light_manager.lightclass
+    hidinfo = {"vendor_id": 0xFFFF, "product_id": 0xFFFF, "path": b"bogus/new"}
+    new_light = mock.Mock(hidinfo=hidinfo)
 
+    with mock.patch.object(
+        lightclass,
+        "available",
+        return_value=[light.hidinfo for light in synthetic_light_manager.lights]
+        + [hidinfo],
+    ), mock.patch.object(
+        lightclass, "from_dict", return_value=new_light
+    ) as mock_from_dict:
+        result = synthetic_light_manager.update()
 
-@pytest.mark.xfail
-def test_list_manager_release(synthetic_light_manager) -> None:
+    mock_from_dict.assert_called_once_with(hidinfo)
+    assert result == (1, nlights, 0)
+    assert len(synthetic_light_manager.lights) == nlights + 1
+    assert synthetic_light_manager.lights[-1] is new_light
+
+
+def test_list_manager_update_light_unavailable(synthetic_light_manager) -> None:
+
+    nlights = len(synthetic_light_manager.lights)
+    lightclass = synthetic_light_manager.lightclass
+    hidinfo = {"vendor_id": 0xFFFF, "product_id": 0xFFFF, "path": b"bogus/new"}
+
+    with mock.patch.object(
+        lightclass, "available", return_value=[hidinfo]
+    ), mock.patch.object(
+        lightclass, "from_dict", side_effect=LightUnavailable.from_dict(hidinfo)
+    ):
+        result = synthetic_light_manager.update()
+
+    assert result == (0, nlights, 0)
+    assert len(synthetic_light_manager.lights) == nlights
+
+
+def test_list_manager_release_twice(synthetic_light_manager, synthetic_lights) -> None:
+
+    synthetic_light_manager.release()
+    synthetic_light_manager.release()
+
+    with pytest.raises(AttributeError):
+        synthetic_light_manager._lights
+
+    assert synthetic_lights
+
+
+@pytest.mark.parametrize("color", [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+def test_list_manager_on(color, synthetic_light_manager) -> None:
+
+    synthetic_light_manager.on(color, timeout=0.01)
+
+    for light in synthetic_light_manager.lights:
+        assert light.color == color
+
+
+def test_list_manager_on_async(synthetic_light_manager) -> None:
+
+    color = (1, 2, 3)
+
+    asyncio.run(synthetic_light_manager.on_async(color, timeout=0.01))
+
+    for light in synthetic_light_manager.lights:
+        assert light.color == color
+
+
+def test_list_manager_on_running_loop(synthetic_light_manager) -> None:
+
+    color = (4, 5, 6)
+
+    async def main() -> None:
+        task = synthetic_light_manager.on(color, timeout=0.01)
+        assert isinstance(task, asyncio.Task)
+        await task
+
+    asyncio.run(main())
+
+    for light in synthetic_light_manager.lights:
+        assert light.color == color
+
+
+def test_list_manager_on_running_loop_task_tracked(synthetic_light_manager) -> None:
+
+    light = synthetic_light_manager.lights[0]
+
+    async def main() -> None:
+        task = synthetic_light_manager.on((7, 8, 9), [0], timeout=0.01)
+        assert task in synthetic_light_manager._scheduled
+
+        with pytest.raises(ValueError):
+            await task
+
+        assert task not in synthetic_light_manager._scheduled
+
+    with mock.patch.object(
+        light, "on", side_effect=ValueError("bad light")
+    ), mock.patch("busylight.manager.logger") as mock_logger:
+        asyncio.run(main())
+
+    mock_logger.error.assert_called_once()
+
+
+def test_list_manager_on_supervisor_starts_light_tasks(
+    synthetic_light_manager,
+) -> None:
+
+    kuandos = [
+        light
+        for light in synthetic_light_manager.lights
+        if isinstance(light, Busylight)
+    ]
+    assert kuandos
+
+    async def main() -> None:
+        await synthetic_light_manager.on_supervisor((13, 14, 15), kuandos, wait=False)
+
+        for light in kuandos:
+            task = light.tasks["keepalive"]
+            assert task in asyncio.all_tasks()
+            assert not task.done()
+            light.cancel_tasks()
+
+    asyncio.run(main())
+
+
+def test_list_manager_apply_effect_async(synthetic_light_manager) -> None:
+
+    color = (7, 8, 9)
+    steady = Effects.for_name("steady")(color)
+
+    asyncio.run(synthetic_light_manager.apply_effect_async(steady, timeout=0.01))
+
+    for light in synthetic_light_manager.lights:
+        assert light.color == color
+
+
+def test_list_manager_apply_effect_running_loop(synthetic_light_manager) -> None:
+
+    color = (10, 11, 12)
+    steady = Effects.for_name("steady")(color)
+
+    async def main() -> None:
+        task = synthetic_light_manager.apply_effect(steady, timeout=0.01)
+        assert isinstance(task, asyncio.Task)
+        await task
+
+    asyncio.run(main())
+
+    for light in synthetic_light_manager.lights:
+        assert light.color == color
+
+
+def test_list_manager_selected_lights_some_unknown(synthetic_light_manager) -> None:
+
+    base = len(synthetic_light_manager.lights)
+
+    result = synthetic_light_manager.selected_lights([base + 1, 0, base + 2])
+
+    assert result == [synthetic_light_manager.lights[0]]
+
+
+def test_list_manager_selected_lights_negative(synthetic_light_manager) -> None:
+
+    with pytest.raises(NoLightsFound):
+        synthetic_light_manager.selected_lights([-1])
+
+
+def test_list_manager_light_ids_stable(synthetic_light_manager) -> None:
+
+    nlights = len(synthetic_light_manager.lights)
+    lightclass = synthetic_light_manager.lightclass
+    hidinfo = {"vendor_id": 0xFFFF, "product_id": 0xFFFF, "path": b"bogus/new"}
+    new_light = mock.Mock(hidinfo=hidinfo)
+
+    with mock.patch.object(
+        lightclass, "available", return_value=[hidinfo]
+    ), mock.patch.object(lightclass, "from_dict", return_value=new_light):
+        synthetic_light_manager.update()
+
+    assert synthetic_light_manager.selected_lights([nlights]) == [new_light]
+    assert str(synthetic_light_manager).splitlines()[-1].split()[0] == str(nlights)
+
+
+def test_list_manager_update_ttl(synthetic_light_manager) -> None:
+
+    with mock.patch.object(
+        synthetic_light_manager.lightclass,
+        "available",
+        return_value=[],
+    ) as mock_available:
+        synthetic_light_manager.update()
+        synthetic_light_manager.update()
+        assert mock_available.call_count == 1
+
+        synthetic_light_manager.refresh()
+        synthetic_light_manager.update()
+        assert mock_available.call_count == 2
+
+
+def test_list_manager_update_ttl_expired(synthetic_light_manager) -> None:
+
+    synthetic_light_manager._lights_ttl = 0
+
+    with mock.patch.object(
+        synthetic_light_manager.lightclass,
+        "available",
+        return_value=[],
+    ) as mock_available:
+        synthetic_light_manager.update()
+        synthetic_light_manager.update()
+        assert mock_available.call_count == 2
+
+
+def test_list_manager_effect_supervisor_same_effect(synthetic_light_manager) -> None:
+
+    lights = synthetic_light_manager.lights
+
+    async def main() -> None:
+        blink = Effects.for_name("blink")((255, 0, 0), 0.01)
+        await synthetic_light_manager.effect_supervisor(blink, lights, wait=False)
+        before = [light.tasks[blink.name] for light in lights]
+
+        again = Effects.for_name("blink")((255, 0, 0), 0.01)
+        await synthetic_light_manager.effect_supervisor(again, lights, wait=False)
+        after = [light.tasks[blink.name] for light in lights]
+
+        assert all(a is b for a, b in zip(before, after))
+        assert not any(task.cancelled() for task in after)
+
+        for light in lights:
+            light.cancel_tasks()
+
+    asyncio.run(main())
+
+
+def test_list_manager_effect_supervisor_new_effect(synthetic_light_manager) -> None:
+
+    lights = synthetic_light_manager.lights
+
+    async def main() -> None:
+        red = Effects.for_name("blink")((255, 0, 0), 0.01)
+        await synthetic_light_manager.effect_supervisor(red, lights, wait=False)
+        before = [light.tasks[red.name] for light in lights]
+
+        green = Effects.for_name("blink")((0, 255, 0), 0.01)
+        await synthetic_light_manager.effect_supervisor(green, lights, wait=False)
+        after = [light.tasks[green.name] for light in lights]
+
+        assert all(a is not b for a, b in zip(before, after))
+
+        for light in lights:
+            light.cancel_tasks()
+
+    asyncio.run(main())
+
+
+async def _poll(condition, timeout: float = 2.0) -> None:
+    """Yields to the event loop until condition() is true or timeout expires."""
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "timed out waiting for condition"
+        await asyncio.sleep(0.001)
+
+
+def test_list_manager_effect_supervisor_broadcast(synthetic_light_manager) -> None:
+
+    lights = synthetic_light_manager.lights
+    blink = Effects.for_name("blink")((1, 1, 1), 0.01, off_color=(2, 2, 2))
+
+    async def main() -> None:
+        await synthetic_light_manager.effect_supervisor(blink, lights, wait=False)
+        await _poll(lambda: all(light.color in blink.color_buffer for light in lights))
+
+        assert len(synthetic_light_manager._broadcasts) == 1
+
+        lights[0].cancel_tasks()
+        lights[0].color = (0, 0, 0)
+
+        # wait for the remaining lights to step through two more frames
+        for _ in range(2):
+            color = lights[1].color
+            await _poll(lambda: lights[1].color != color)
+
+        assert lights[0].color == (0, 0, 0)
+        for light in lights[1:]:
+            assert light.color in blink.color_buffer
+
+        for light in lights[1:]:
+            light.cancel_tasks()
+
+        await _poll(lambda: not synthetic_light_manager._broadcasts)
+
+    asyncio.run(main())
+
+
+def test_list_manager_effect_supervisor_broadcast_light_raises(
+    synthetic_light_manager,
+) -> None:
+
+    lights = synthetic_light_manager.lights[:2]
+    bad, good = lights
+    blink = Effects.for_name("blink")((5, 5, 5), 0.01, off_color=(6, 6, 6))
+
+    async def main() -> None:
+        with mock.patch.object(bad, "on", side_effect=ValueError("bad light")):
+            await synthetic_light_manager.effect_supervisor(blink, lights, wait=False)
+            await _poll(lambda: bad.tasks[blink.name].done())
+
+            # the healthy light keeps stepping through frames
+            for _ in range(3):
+                color = good.color
+                await _poll(lambda: good.color != color)
+
+        assert bad.tasks[blink.name].cancelled()
+        assert len(synthetic_light_manager._broadcasts) == 1
+
+        good.cancel_tasks()
+        await _poll(lambda: not synthetic_light_manager._broadcasts)
+
+    asyncio.run(main())
+
+
+def test_list_manager_effect_supervisor_timeout(synthetic_light_manager) -> None:
+
+    lights = synthetic_light_manager.lights
+    blink = Effects.for_name("blink")((3, 3, 3), 0.01)
+
+    async def main() -> None:
+        supervisor = asyncio.get_running_loop().create_task(
+            synthetic_light_manager.effect_supervisor(blink, lights, timeout=0.05)
+        )
+        await _poll(lambda: all(blink.name in light.tasks for light in lights))
+        tasks = [light.tasks[blink.name] for light in lights]
+
+        await supervisor
+        await _poll(lambda: not synthetic_light_manager._broadcasts)
+
+        assert all(task.cancelled() for task in tasks)
+        for light in lights:
+            assert blink.name not in light.tasks
+        assert not synthetic_light_manager._applied_effects
+
+    asyncio.run(main())
+
+
+def test_list_manager_effect_supervisor_cancelled(synthetic_light_manager) -> None:
+
+    lights = synthetic_light_manager.lights
+    blink = Effects.for_name("blink")((4, 4, 4), 0.01)
+
+    async def main() -> None:
+        supervisor = asyncio.get_running_loop().create_task(
+            synthetic_light_manager.effect_supervisor(blink, lights)
+        )
+        await _poll(lambda: all(light.color in blink.color_buffer for light in lights))
+        tasks = [light.tasks[blink.name] for light in lights]
+
+        supervisor.cancel()
+        await _poll(lambda: not synthetic_light_manager._broadcasts)
+
+        assert all(task.cancelled() for task in tasks)
+        for light in lights:
+            assert blink.name not in light.tasks
+
+    asyncio.run(main())
+
+
+def test_list_manager_apply_effect_twice_with_timeout(synthetic_light_manager) -> None:
+
+    light = synthetic_light_manager.lights[0]
+    timeout = 0.1
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        for _ in range(2):
+            blink = Effects.for_name("blink")((7, 7, 7), 0.01)
+            writes = light.device.write.call_count
+            start = loop.time()
+            await synthetic_light_manager.apply_effect_async(blink, [0], timeout)
+            assert loop.time() - start >= timeout * 0.9
+            assert light.device.write.call_count > writes
 
-    assert False, "Not written yet"
+    asyncio.run(main())